@@ -1,96 +1,246 @@
 import csv
 from datetime import datetime, timedelta
 import random
-import uuid
 import argparse
 import json
+import re
+from operator import itemgetter
+from itertools import accumulate
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
 
-def generate_transaction_id():
+TRANSACTION_TYPES = ['Purchase', 'Payment', 'Transfer', 'Deposit', 'Withdrawal']
+EXPENSE_TYPES = frozenset({'Purchase', 'Payment'})
+WINTER_MONTHS = frozenset({1, 2, 12})
+DESCRIPTION_CATEGORIES = ['Office Supplies', 'Equipment', 'Services', 'Miscellaneous']
+
+# Preformatted account numbers and "<type> - <category>" descriptions
+ACCOUNT_NUMBERS = [f"ACCT-{i}" for i in range(1000, 10000)]
+TRANSACTION_DESCRIPTIONS = {
+    transaction_type: [f"{transaction_type} - {category}" for category in DESCRIPTION_CATEGORIES]
+    for transaction_type in TRANSACTION_TYPES
+}
+
+# First-digit distribution under Benford's Law, cumulated once so that
+# random.choices does not rebuild it on every draw
+BENFORD_DIGITS = range(1, 10)
+BENFORD_CUM_WEIGHTS = list(accumulate([30.1, 17.6, 12.5, 9.7, 7.9, 6.7, 5.8, 5.1, 4.6]))
+
+# Number of rows formatted and written per file.write call in save_to_csv
+CSV_CHUNK_SIZE = 10000
+
+# Maps a random hex digit to a valid RFC 4122 variant digit (8, 9, a or b)
+UUID_VARIANT_DIGITS = {digit: '89ab'[int(digit, 16) & 3] for digit in '0123456789abcdef'}
+
+def generate_transaction_ids(n, rng=random):
     """
-    Generate a unique transaction ID.
+    Generate several unique transaction IDs in one batch.
+
+    All random bits are drawn in a single call and formatted directly as
+    version 4 UUID strings, so a seeded generator gives reproducible IDs.
+
+    Args:
+        n (int): The number of IDs to generate.
+        rng (random.Random, optional): The random number generator to draw from.
+            Defaults to the module-level generator of the random module.
 
     Returns:
-        str: A unique UUID as a string.
+        list: A list of n unique UUIDs as strings.
     """
-    return str(uuid.uuid4())
+    if n <= 0:
+        return []
+    h = rng.getrandbits(128 * n).to_bytes(16 * n, 'big').hex()
+    return [
+        f"{h[i:i + 8]}-{h[i + 8:i + 12]}-4{h[i + 13:i + 16]}-"
+        f"{UUID_VARIANT_DIGITS[h[i + 16]]}{h[i + 17:i + 20]}-{h[i + 20:i + 32]}"
+        for i in range(0, 32 * n, 32)
+    ]
 
-def benford_amount():
+def benford_amount(rng=random):
     """
     Generate an amount that follows Benford's Law.
 
+    Args:
+        rng (random.Random, optional): The random number generator to draw from.
+            Defaults to the module-level generator of the random module.
+
     Returns:
         float: A float value where the first digit follows Benford's Law distribution.
     """
-    first_digit = random.choices(range(1, 10), weights=[30.1, 17.6, 12.5, 9.7, 7.9, 6.7, 5.8, 5.1, 4.6])[0]
-    rest_digits = random.randint(0, 999999)
-    return float(f"{first_digit}.{rest_digits:06d}")
+    first_digit = rng.choices(BENFORD_DIGITS, cum_weights=BENFORD_CUM_WEIGHTS)[0]
+    rest_digits = rng.randint(0, 999999)
+    return first_digit + rest_digits / 1e6
 
-def generate_recurring_transactions(config):
+def benford_amounts(n, rng=random):
+    """
+    Generate several amounts that follow Benford's Law in one batch.
+
+    Args:
+        n (int): The number of amounts to generate.
+        rng (random.Random, optional): The random number generator to draw from.
+            Defaults to the module-level generator of the random module.
+
+    Returns:
+        list: A list of n floats where the first digits follow Benford's Law distribution.
+    """
+    first_digits = rng.choices(BENFORD_DIGITS, cum_weights=BENFORD_CUM_WEIGHTS, k=n)
+    rest_digits = rng.choices(range(1000000), k=n)
+    return [first_digit + rest / 1e6 for first_digit, rest in zip(first_digits, rest_digits)]
+
+def generate_date_strings(config):
+    """
+    Format every date in the configured range once.
+
+    Args:
+        config (dict): The configuration dictionary containing start_date and end_date.
+
+    Returns:
+        list: The formatted dates ('%Y-%m-%d'), indexed by day offset from start_date.
+    """
+    date_range = (config['end_date'] - config['start_date']).days
+    start_date = config['start_date'].date()
+    # isoformat() gives the same '%Y-%m-%d' text without strftime's format parsing
+    return [(start_date + timedelta(days=i)).isoformat() for i in range(date_range + 1)]
+
+def generate_recurring_transactions(config, rng=random):
     """
     Generate recurring transactions based on the configuration.
 
     Args:
         config (dict): The configuration dictionary containing start_date, end_date, and recurring_transactions.
+        rng (random.Random, optional): The random number generator to draw from.
+            Defaults to the module-level generator of the random module.
 
     Returns:
         list: A list of recurring transactions.
     """
+    # Templates due on each day of month, in config order
+    day_to_rts = {}
+    for rt in config.get('recurring_transactions', []):
+        day_to_rts.setdefault(rt['day'], []).append(rt)
+
+    # Walk the date table in order so rows come out by date, then by template order,
+    # which later irregularities (cumulative, skimming) rely on
+    scheduled = [
+        (date, rt)
+        for date in generate_date_strings(config)
+        for rt in day_to_rts.get(int(date[8:10]), ())
+    ]
+    accounts = rng.choices(ACCOUNT_NUMBERS, k=len(scheduled))
+    transaction_ids = generate_transaction_ids(len(scheduled), rng)
+
+    uniform = rng.uniform  # bound once, called for every recurring row
     transactions = []
-    current_date = config['start_date']
-    while current_date <= config['end_date']:
-        for rt in config.get('recurring_transactions', []):
-            if current_date.day == rt['day']:
-                amount = rt['amount'] * random.uniform(0.95, 1.05)
-                transactions.append([
-                    generate_transaction_id(),
-                    current_date.strftime('%Y-%m-%d'),
-                    'Payment',
-                    round(amount, 2),
-                    f"ACCT-{random.randint(1000, 9999)}",
-                    rt['description'],
-                    rt['vendor']
-                ])
-        current_date += timedelta(days=1)
+    for transaction_id, (date, rt), account in zip(transaction_ids, scheduled, accounts):
+        amount = rt['amount'] * uniform(0.95, 1.05)
+        transactions.append([
+            transaction_id,
+            date,
+            'Payment',
+            round(amount, 2),
+            account,
+            rt['description'],
+            rt['vendor']
+        ])
     return transactions
 
-def generate_random_transactions(config):
+def random_transaction_count(config):
+    """
+    Work out how many random transactions to generate on top of the recurring ones.
+
+    Args:
+        config (dict): The configuration dictionary containing start_date, end_date, num_transactions,
+            and recurring_transactions.
+
+    Returns:
+        int: The number of random transactions, or 0 if the recurring ones already exceed num_transactions.
+    """
+    date_range = (config['end_date'] - config['start_date']).days
+    return max(0, config['num_transactions'] - len(config.get('recurring_transactions', [])) * date_range // 30)
+
+def generate_random_transactions(config, rng=random, count=None):
     """
     Generate random transactions based on the configuration.
 
     Args:
         config (dict): The configuration dictionary containing start_date, end_date, num_transactions, and vendors.
+        rng (random.Random, optional): The random number generator to draw from.
+            Defaults to the module-level generator of the random module.
+        count (int, optional): The number of transactions to generate.
+            Defaults to the count derived from the configuration.
 
     Returns:
         list: A list of random transactions.
     """
-    transactions = []
-    date_range = (config['end_date'] - config['start_date']).days
-    num_random = config['num_transactions'] - len(config.get('recurring_transactions', [])) * date_range // 30
+    num_random = random_transaction_count(config) if count is None else count
 
     vendors = config.get('vendors', [])
     if not vendors:
         vendors = ["Default Vendor"]  # Fallback if no vendors are specified
 
-    for _ in range(num_random):
-        date = config['start_date'] + timedelta(days=random.randint(0, date_range))
-        transaction_type = random.choice(['Purchase', 'Payment', 'Transfer', 'Deposit', 'Withdrawal'])
-        amount = round(benford_amount() * 1000, 2)
-        account = f"ACCT-{random.randint(1000, 9999)}"
-        vendor = random.choice(vendors)
-        description = f"{transaction_type} - {random.choice(['Office Supplies', 'Equipment', 'Services', 'Miscellaneous'])}"
-        
-        transactions.append([
-            generate_transaction_id(),
-            date.strftime('%Y-%m-%d'),
+    # Draw every random column in bulk, then assemble the rows at the end
+    dates = rng.choices(generate_date_strings(config), k=num_random)
+    transaction_types = rng.choices(TRANSACTION_TYPES, k=num_random)
+    categories = rng.choices(range(len(DESCRIPTION_CATEGORIES)), k=num_random)
+    accounts = rng.choices(ACCOUNT_NUMBERS, k=num_random)
+    chosen_vendors = rng.choices(vendors, k=num_random)
+    amounts = benford_amounts(num_random, rng)
+    transaction_ids = generate_transaction_ids(num_random, rng)
+
+    return [
+        [
+            transaction_id,
+            date,
             transaction_type,
-            amount,
+            round(amount * 1000, 2),
             account,
-            description,
+            TRANSACTION_DESCRIPTIONS[transaction_type][category],
             vendor
-        ])
+        ]
+        for transaction_id, date, transaction_type, category, account, vendor, amount in zip(
+            transaction_ids, dates, transaction_types, categories, accounts, chosen_vendors, amounts)
+    ]
+
+def generate_random_transaction_chunk(config, seed, count):
+    """
+    Generate one chunk of random transactions in a worker process.
+
+    Args:
+        config (dict): The configuration dictionary.
+        seed (int): The seed for this chunk's own random number generator.
+        count (int): The number of transactions to generate.
+
+    Returns:
+        list: A list of random transactions.
+    """
+    return generate_random_transactions(config, random.Random(seed), count)
+
+def generate_random_transactions_parallel(config, rng, workers):
+    """
+    Generate random transactions split across several worker processes.
+
+    Each worker draws from its own generator, seeded from rng, so a seeded rng
+    still gives reproducible output for a given number of workers.
+
+    Args:
+        config (dict): The configuration dictionary containing start_date, end_date, num_transactions, and vendors.
+        rng (random.Random): The random number generator used to seed the workers.
+        workers (int): The number of worker processes.
+
+    Returns:
+        list: A list of random transactions.
+    """
+    num_random = random_transaction_count(config)
+    counts = [num_random // workers + (i < num_random % workers) for i in range(workers)]
+    seeds = [rng.getrandbits(64) for _ in range(workers)]
+
+    transactions = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk in executor.map(generate_random_transaction_chunk, [config] * workers, seeds, counts):
+            transactions.extend(chunk)
     return transactions
 
-def apply_irregularities(transactions, config):
+def apply_irregularities(transactions, config, rng=random):
     """
     Apply irregularities to the transactions based on the configuration.
 
@@ -105,6 +255,8 @@ def apply_irregularities(transactions, config):
         config (dict): The configuration dictionary containing irregularity settings.
             Expected to have an 'irregularities' key with sub-dictionaries for
             each irregularity type, including 'cumulative_irregularity'.
+        rng (random.Random, optional): The random number generator to draw from.
+            Defaults to the module-level generator of the random module.
 
     Returns:
         list: A list of tuples, each containing:
@@ -152,21 +304,24 @@ def apply_irregularities(transactions, config):
 
     for irregularity_type, irregularity_function in irregularity_functions.items():
         count = irregularity_config.get(irregularity_type, {}).get('count', 0)
-        irregularities_to_apply.extend([irregularity_type] * count)
+        # Keep the function next to its name so the loop below needs no lookup
+        irregularities_to_apply.extend([(irregularity_type, irregularity_function)] * count)
 
-    random.shuffle(irregularities_to_apply)
+    rng.shuffle(irregularities_to_apply)
     
     #print(f"Irregularities to apply: {irregularities_to_apply}")
 
-    for irregularity_type in irregularities_to_apply:
-        index = random.randint(0, len(transactions) - 1)
-        description = irregularity_functions[irregularity_type](transactions, index, config)
+    # Draw all target rows up front; only the original transactions are candidates,
+    # not the rows appended by double_spend
+    indices = rng.choices(range(len(transactions)), k=len(irregularities_to_apply))
+    for (irregularity_type, irregularity_function), index in zip(irregularities_to_apply, indices):
+        description = irregularity_function(transactions, index, config, rng)
         applied_irregularities.append((transactions[index][0], irregularity_type, description))
         #print(f"Applied {irregularity_type}: {description}")
 
     return applied_irregularities
 
-def apply_cumulative_irregularity(transactions, config):
+def apply_cumulative_irregularity(transactions, config, rng=random):
     """
     Apply cumulative irregularity to the transactions based on the configuration.
 
@@ -178,6 +333,8 @@ def apply_cumulative_irregularity(transactions, config):
     Args:
         transactions (list): A list of transaction records to potentially modify.
         config (dict): The configuration dictionary containing irregularity settings.
+        rng (random.Random, optional): The random number generator to draw from.
+            Defaults to the module-level generator of the random module.
 
     Returns:
         list: A list of tuples, each containing:
@@ -198,25 +355,25 @@ def apply_cumulative_irregularity(transactions, config):
         return applied_irregularities
 
     count = irregularity_config.get('count', 0)
-    total_expenses = sum(t[3] for t in transactions if t[2] in ['Purchase', 'Payment'])
+    # Single pass over all transactions; only the first `count` expenses are candidates
+    expenses = [t for t in transactions if t[2] in EXPENSE_TYPES]
+    total_expenses = sum(t[3] for t in expenses)
     threshold = total_expenses * irregularity_config.get('threshold', 0.005)
-    cumulative_irregular = 0
-
-    for transaction in transactions:
-        if len(applied_irregularities) >= count:
-            break
-        if transaction[2] in ['Purchase', 'Payment']:
-            irregular_amount = round(random.uniform(1, 10), 2)
-            transaction[3] += irregular_amount
-            cumulative_irregular += irregular_amount
-            applied_irregularities.append((transaction[0], 'cumulative_irregularity', f"Amount increased by {irregular_amount:.2f}"))
-            if cumulative_irregular > threshold:
-                break
+
+    candidates = expenses[:max(0, count)]  # a negative count applies nothing, not 'all but the last'
+    uniform = rng.uniform
+    irregular_amounts = [round(uniform(1, 10), 2) for _ in candidates]
+    # Stop right after the first increment that takes the running total past the threshold
+    stop = bisect_right(list(accumulate(irregular_amounts)), threshold) + 1
+
+    for transaction, irregular_amount in zip(candidates[:stop], irregular_amounts):
+        transaction[3] += irregular_amount
+        applied_irregularities.append((transaction[0], 'cumulative_irregularity', f"Amount increased by {irregular_amount:.2f}"))
 
     return applied_irregularities
 
 # Irregularity functions
-def high_amount(transactions, index, config):
+def high_amount(transactions, index, config, rng=random):
     """
     Apply high amount irregularity to a transaction.
 
@@ -224,15 +381,17 @@ def high_amount(transactions, index, config):
         transactions (list): The list of transactions.
         index (int): The index of the transaction to modify.
         config (dict): The configuration dictionary.
+        rng (random.Random, optional): The random number generator to draw from.
+            Defaults to the module-level generator of the random module.
 
     Returns:
         str: Description of the applied irregularity.
     """
     original_amount = transactions[index][3]
-    transactions[index][3] = round(random.uniform(50000, 100000), 2)
+    transactions[index][3] = round(rng.uniform(50000, 100000), 2)
     return f"Amount increased from {original_amount:.2f} to {transactions[index][3]:.2f}"
 
-def frequency_change(transactions, index, config):
+def frequency_change(transactions, index, config, rng=random):
     """
     Apply frequency change irregularity to a recurring transaction.
 
@@ -240,18 +399,24 @@ def frequency_change(transactions, index, config):
         transactions (list): The list of transactions.
         index (int): The index of the transaction to modify.
         config (dict): The configuration dictionary.
+        rng (random.Random, optional): The random number generator to draw from.
+            Defaults to the module-level generator of the random module.
 
     Returns:
         str: Description of the applied irregularity.
     """
-    if any(rt['description'] in transactions[index][5] for rt in config.get('recurring_transactions', [])):
+    if '_recurring_description_pattern' in config:
+        pattern = config['_recurring_description_pattern']
+    else:
+        pattern = compile_recurring_description_pattern(config)
+    if pattern is not None and pattern.search(transactions[index][5]):
         original_date = transactions[index][1]
-        new_day = random.randint(1, 28)
+        new_day = rng.randint(1, 28)
         transactions[index][1] = transactions[index][1][:8] + f"{new_day:02d}"
         return f"Date changed from {original_date} to {transactions[index][1]}"
     return "No change (not a recurring transaction)"
 
-def double_spend(transactions, index, config):
+def double_spend(transactions, index, config, rng=random):
     """
     Apply double spend irregularity by duplicating a transaction.
 
@@ -259,18 +424,22 @@ def double_spend(transactions, index, config):
         transactions (list): The list of transactions.
         index (int): The index of the transaction to duplicate.
         config (dict): The configuration dictionary.
+        rng (random.Random, optional): The random number generator to draw from.
+            Defaults to the module-level generator of the random module.
 
     Returns:
         str: Description of the applied irregularity.
     """
     duplicate = transactions[index].copy()
-    duplicate[0] = generate_transaction_id()
+    duplicate[0] = generate_transaction_ids(1, rng)[0]
     original_date = duplicate[1]
-    duplicate[1] = (datetime.strptime(duplicate[1], '%Y-%m-%d') + timedelta(minutes=random.randint(1, 60))).strftime('%Y-%m-%d %H:%M')
+    # Between 1 and 60 minutes past midnight on the same day
+    hours, minutes = divmod(rng.randint(1, 60), 60)
+    duplicate[1] = f"{original_date[:10]} {hours:02d}:{minutes:02d}"
     transactions.append(duplicate)
     return f"Transaction duplicated with new ID {duplicate[0]} and date changed from {original_date} to {duplicate[1]}"
 
-def missing_id(transactions, index, config):
+def missing_id(transactions, index, config, rng=random):
     """
     Apply missing ID irregularity to a transaction.
 
@@ -278,6 +447,8 @@ def missing_id(transactions, index, config):
         transactions (list): The list of transactions.
         index (int): The index of the transaction to modify.
         config (dict): The configuration dictionary.
+        rng (random.Random, optional): The random number generator to draw from.
+            Defaults to the module-level generator of the random module.
 
     Returns:
         str: Description of the applied irregularity.
@@ -286,7 +457,7 @@ def missing_id(transactions, index, config):
     transactions[index][0] = ''
     return f"Transaction ID removed (original ID: {original_id})"
 
-def incorrect_date(transactions, index, config):
+def incorrect_date(transactions, index, config, rng=random):
     """
     Apply incorrect date irregularity to a transaction.
 
@@ -294,16 +465,18 @@ def incorrect_date(transactions, index, config):
         transactions (list): The list of transactions.
         index (int): The index of the transaction to modify.
         config (dict): The configuration dictionary.
+        rng (random.Random, optional): The random number generator to draw from.
+            Defaults to the module-level generator of the random module.
 
     Returns:
         str: Description of the applied irregularity.
     """
     original_date = transactions[index][1]
-    future_date = config['end_date'] + timedelta(days=random.randint(1, 30))
+    future_date = config['end_date'] + timedelta(days=rng.randint(1, 30))
     transactions[index][1] = future_date.strftime('%Y-%m-%d')
     return f"Date changed from {original_date} to future date {transactions[index][1]}"
 
-def mismatched_description(transactions, index, config):
+def mismatched_description(transactions, index, config, rng=random):
     """
     Apply mismatched description irregularity to a transaction.
 
@@ -311,6 +484,8 @@ def mismatched_description(transactions, index, config):
         transactions (list): The list of transactions.
         index (int): The index of the transaction to modify.
         config (dict): The configuration dictionary.
+        rng (random.Random, optional): The random number generator to draw from.
+            Defaults to the module-level generator of the random module.
 
     Returns:
         str: Description of the applied irregularity.
@@ -322,7 +497,7 @@ def mismatched_description(transactions, index, config):
         transactions[index][5] = 'Deposit - Miscellaneous'
     return f"Description changed from '{original_description}' to '{transactions[index][5]}'"
 
-def wrong_account(transactions, index, config):
+def wrong_account(transactions, index, config, rng=random):
     """
     Apply wrong account irregularity to a transaction.
 
@@ -330,15 +505,17 @@ def wrong_account(transactions, index, config):
         transactions (list): The list of transactions.
         index (int): The index of the transaction to modify.
         config (dict): The configuration dictionary.
+        rng (random.Random, optional): The random number generator to draw from.
+            Defaults to the module-level generator of the random module.
 
     Returns:
         str: Description of the applied irregularity.
     """
     original_account = transactions[index][4]
-    transactions[index][4] = f"WRONG-{random.randint(100, 999)}"
+    transactions[index][4] = f"WRONG-{rng.randint(100, 999)}"
     return f"Account number changed from {original_account} to {transactions[index][4]}"
 
-def personal_expense(transactions, index, config):
+def personal_expense(transactions, index, config, rng=random):
     """
     Apply personal expense irregularity to a transaction.
 
@@ -346,6 +523,8 @@ def personal_expense(transactions, index, config):
         transactions (list): The list of transactions.
         index (int): The index of the transaction to modify.
         config (dict): The configuration dictionary.
+        rng (random.Random, optional): The random number generator to draw from.
+            Defaults to the module-level generator of the random module.
 
     Returns:
         str: Description of the applied irregularity.
@@ -355,14 +534,14 @@ def personal_expense(transactions, index, config):
     original_vendor = transactions[index][6]
     original_description = transactions[index][5]
     original_amount = transactions[index][3]
-    transactions[index][6] = random.choice(personal_vendors)
-    transactions[index][5] = random.choice(personal_descriptions)
-    transactions[index][3] = round(random.uniform(100, 5000), 2)
+    transactions[index][6] = rng.choice(personal_vendors)
+    transactions[index][5] = rng.choice(personal_descriptions)
+    transactions[index][3] = round(rng.uniform(100, 5000), 2)
     return f"Changed to personal expense: Vendor from '{original_vendor}' to '{transactions[index][6]}', " \
            f"Description from '{original_description}' to '{transactions[index][5]}', " \
            f"Amount from {original_amount:.2f} to {transactions[index][3]:.2f}"
 
-def benford_violation(transactions, index, config):
+def benford_violation(transactions, index, config, rng=random):
     """
     Apply Benford's Law violation irregularity to a transaction.
 
@@ -370,17 +549,19 @@ def benford_violation(transactions, index, config):
         transactions (list): The list of transactions.
         index (int): The index of the transaction to modify.
         config (dict): The configuration dictionary.
+        rng (random.Random, optional): The random number generator to draw from.
+            Defaults to the module-level generator of the random module.
 
     Returns:
         str: Description of the applied irregularity.
     """
     original_amount = transactions[index][3]
-    first_digit = random.choice([5, 6])
-    rest_digits = random.randint(0, 999999)
-    transactions[index][3] = float(f"{first_digit}.{rest_digits:06d}") * 1000
+    first_digit = rng.choice([5, 6])
+    rest_digits = rng.randint(0, 999999)
+    transactions[index][3] = (first_digit + rest_digits / 1e6) * 1000
     return f"Amount changed from {original_amount:.2f} to {transactions[index][3]:.2f} (violating Benford's Law)"
 
-def subtle_skimming(transactions, index, config):
+def subtle_skimming(transactions, index, config, rng=random):
     """
     Apply subtle skimming irregularity to a set of transactions.
 
@@ -388,6 +569,8 @@ def subtle_skimming(transactions, index, config):
         transactions (list): The list of transactions.
         index (int): The starting index of the transactions to modify.
         config (dict): The configuration dictionary.
+        rng (random.Random, optional): The random number generator to draw from.
+            Defaults to the module-level generator of the random module.
 
     Returns:
         str: Description of the applied irregularity.
@@ -399,7 +582,7 @@ def subtle_skimming(transactions, index, config):
         affected_transactions.append(f"Transaction {transactions[i][0]}: {original_amount:.2f} to {transactions[i][3]:.2f}")
     return f"Subtle skimming applied to {len(affected_transactions)} transactions: " + ", ".join(affected_transactions)
 
-def seasonal_anomaly(transactions, index, config):
+def seasonal_anomaly(transactions, index, config, rng=random):
     """
     Apply seasonal anomaly irregularity to a transaction.
 
@@ -407,28 +590,26 @@ def seasonal_anomaly(transactions, index, config):
         transactions (list): The list of transactions.
         index (int): The index of the transaction to modify.
         config (dict): The configuration dictionary.
+        rng (random.Random, optional): The random number generator to draw from.
+            Defaults to the module-level generator of the random module.
 
     Returns:
         str: Description of the applied irregularity.
     """
-    date_str = transactions[index][1]
-    # Handle potential time component in the date string
-    if ' ' in date_str:
-        date_str = date_str.split(' ')[0]  # Take only the date part
-    
-    transaction_date = datetime.strptime(date_str, '%Y-%m-%d')
+    # Dates are 'YYYY-MM-DD' (optionally followed by a time), so the month can be read directly
+    month = int(transactions[index][1][5:7])
     
-    if transaction_date.month in [1, 2, 12]:  # Winter months
+    if month in WINTER_MONTHS:
         original_description = transactions[index][5]
         original_amount = transactions[index][3]
         transactions[index][5] = "Summer Equipment Purchase"
-        transactions[index][3] = round(random.uniform(5000, 10000), 2)
+        transactions[index][3] = round(rng.uniform(5000, 10000), 2)
         return f"Seasonal anomaly: Description changed from '{original_description}' to '{transactions[index][5]}', " \
                f"Amount changed from {original_amount:.2f} to {transactions[index][3]:.2f} during winter month"
     return "No change (not in winter months)"
 
 
-def round_number_bias(transactions, index, config):
+def round_number_bias(transactions, index, config, rng=random):
     """
     Apply round number bias irregularity to a transaction.
 
@@ -436,6 +617,8 @@ def round_number_bias(transactions, index, config):
         transactions (list): The list of transactions.
         index (int): The index of the transaction to modify.
         config (dict): The configuration dictionary.
+        rng (random.Random, optional): The random number generator to draw from.
+            Defaults to the module-level generator of the random module.
 
     Returns:
         str: Description of the applied irregularity.
@@ -444,6 +627,22 @@ def round_number_bias(transactions, index, config):
     transactions[index][3] = round(transactions[index][3], -2)  # Round to nearest 100
     return f"Amount rounded from {original_amount:.2f} to {transactions[index][3]:.2f}"
 
+def compile_recurring_description_pattern(config):
+    """
+    Compile a pattern matching any description that contains a recurring transaction description.
+
+    Args:
+        config (dict): The configuration dictionary containing recurring_transactions.
+
+    Returns:
+        re.Pattern: The compiled alternation of all recurring descriptions,
+            or None if there are no recurring transactions.
+    """
+    descriptions = [rt['description'] for rt in config.get('recurring_transactions', [])]
+    if not descriptions:
+        return None
+    return re.compile('|'.join(re.escape(description) for description in descriptions))
+
 def load_config(config_file):
     """
     Load and parse the configuration file.
@@ -458,6 +657,8 @@ def load_config(config_file):
         config = json.load(f)
     config['start_date'] = datetime.strptime(config['start_date'], '%Y-%m-%d')
     config['end_date'] = datetime.strptime(config['end_date'], '%Y-%m-%d')
+    # Used by frequency_change to recognise recurring transactions
+    config['_recurring_description_pattern'] = compile_recurring_description_pattern(config)
     return config
 
 
@@ -472,10 +673,23 @@ def save_to_csv(transactions, filename):
     Returns:
         None: This function writes to a file.
     """
-    with open(filename, 'w', newline='') as file:
-        writer = csv.writer(file)
-        writer.writerow(['Transaction ID', 'Date', 'Type', 'Amount', 'Account', 'Description', 'Vendor'])
-        writer.writerows(transactions)
+    header = ['Transaction ID', 'Date', 'Type', 'Amount', 'Account', 'Description', 'Vendor']
+    # Only descriptions and vendors can come from the configuration; all other fields are generated
+    free_text = {t[5] for t in transactions} | {t[6] for t in transactions}
+    with open(filename, 'w', newline='', buffering=1 << 20) as file:
+        if any(not isinstance(value, str) or any(char in value for char in ',"\r\n') for value in free_text):
+            # Some values are not plain strings or need quoting, leave those to the csv module
+            writer = csv.writer(file)
+            writer.writerow(header)
+            writer.writerows(transactions)
+            return
+        # Nothing needs quoting, so format the rows directly (same output as csv.writer)
+        file.write(','.join(header) + '\r\n')
+        for start in range(0, len(transactions), CSV_CHUNK_SIZE):
+            file.write(''.join([
+                f"{t[0]},{t[1]},{t[2]},{t[3]},{t[4]},{t[5]},{t[6]}\r\n"
+                for t in transactions[start:start + CSV_CHUNK_SIZE]
+            ]))
 
 def save_irregularities_to_csv(irregularities, filename):
     """
@@ -495,19 +709,40 @@ def save_irregularities_to_csv(irregularities, filename):
         writer.writerows(irregularities)
     print(f"Finished saving irregularities to {filename}")
 
-def generate_transactions(config):
+def generate_transactions(config, rng=None):
+    """
+    Generate all transactions and apply the configured irregularities.
+
+    Args:
+        config (dict): The configuration dictionary.
+        rng (random.Random, optional): The random number generator shared by the
+            transaction generators and irregularities. If omitted, one is created from
+            the optional 'seed' configuration value.
+
+    Returns:
+        tuple: The transactions sorted by date and the list of applied irregularities.
+    """
+    if rng is None:
+        rng = random.Random(config.get('seed'))
+    workers = config.get('workers', 1)
+    if not isinstance(workers, int) or isinstance(workers, bool) or workers < 1:
+        raise ValueError(f"'workers' must be a positive integer, got {workers!r}")
+
     transactions = []
-    transactions.extend(generate_recurring_transactions(config))
-    transactions.extend(generate_random_transactions(config))
+    transactions.extend(generate_recurring_transactions(config, rng))
+    if workers > 1:
+        transactions.extend(generate_random_transactions_parallel(config, rng, workers))
+    else:
+        transactions.extend(generate_random_transactions(config, rng))
     
     irregularities = []
     double_spend_count = 0
-    for irregularity in apply_irregularities(transactions, config):
+    for irregularity in apply_irregularities(transactions, config, rng):
         if irregularity[1] == 'double_spend':
             double_spend_count += 1
         irregularities.append(irregularity)
     
-    cumulative_irregularities = apply_cumulative_irregularity(transactions, config)
+    cumulative_irregularities = apply_cumulative_irregularity(transactions, config, rng)
     if cumulative_irregularities:
         irregularities.extend(cumulative_irregularities)
 
@@ -515,7 +750,27 @@ def generate_transactions(config):
     print(f"Other irregularities: {len(irregularities) - double_spend_count}")
     print(f"Cumulative irregularities: {len(cumulative_irregularities)}")
     
-    return sorted(transactions, key=lambda x: x[1]), irregularities
+    # Sort in place; sorted() would also allocate a copy of the list of row references
+    transactions.sort(key=itemgetter(1))
+    return transactions, irregularities
+
+def worker_count(value):
+    """
+    Parse the --workers command-line value.
+
+    Args:
+        value (str): The value given on the command line.
+
+    Returns:
+        int: The number of worker processes.
+
+    Raises:
+        ValueError: If the value is not a positive integer.
+    """
+    workers = int(value)
+    if workers < 1:
+        raise ValueError(f"workers must be a positive integer, got {workers}")
+    return workers
 
 def main():
     """
@@ -531,9 +786,15 @@ def main():
     parser.add_argument('-c', '--config', default='config.json', help='Path to the configuration file')
     parser.add_argument('-o', '--output', default='fake_transactions.csv', help='Output CSV file name for transactions')
     parser.add_argument('-a', '--anomalies', default='irregularities.csv', help='Output CSV file name for irregularities')
+    parser.add_argument('-w', '--workers', type=worker_count, help='Number of processes generating random transactions (overrides the config file)')
+    parser.add_argument('-s', '--seed', type=int, help='Random seed for reproducible output (overrides the config file)')
     args = parser.parse_args()
 
     config = load_config(args.config)
+    if args.seed is not None:
+        config['seed'] = args.seed
+    if args.workers is not None:
+        config['workers'] = args.workers
     transactions, irregularities = generate_transactions(config)
     
     print(f"Number of irregularities before saving: {len(irregularities)}")